@@ -27,20 +27,20 @@ class ColourFormatter(Formatter):
     """ Colour formatter for pretty log output.
     """
 
+    _colours = {
+        CRITICAL: ("\x1b[31;1m", "\x1b[0m"),  # bright red
+        ERROR: ("\x1b[33;1m", "\x1b[0m"),     # bright yellow
+        WARNING: ("\x1b[33m", "\x1b[0m"),     # yellow
+        INFO: ("\x1b[37m", "\x1b[0m"),        # white
+        DEBUG: ("\x1b[36m", "\x1b[0m"),       # cyan
+    }
+
     def format(self, record):
         s = super(ColourFormatter, self).format(record)
-        if record.levelno == CRITICAL:
-            return "\x1b[31;1m%s\x1b[0m" % s  # bright red
-        elif record.levelno == ERROR:
-            return "\x1b[33;1m%s\x1b[0m" % s  # bright yellow
-        elif record.levelno == WARNING:
-            return "\x1b[33m%s\x1b[0m" % s    # yellow
-        elif record.levelno == INFO:
-            return "\x1b[37m%s\x1b[0m" % s    # white
-        elif record.levelno == DEBUG:
-            return "\x1b[36m%s\x1b[0m" % s    # cyan
-        else:
+        colour = self._colours.get(record.levelno)
+        if colour is None:
             return s
+        return colour[0] + s + colour[1]
 
 
 class Watcher:
@@ -53,7 +53,8 @@ class Watcher:
         super(Watcher, self).__init__()
         self.logger_names = logger_names
         self.loggers = [getLogger(name) for name in self.logger_names]
-        self.formatter = ColourFormatter("%(asctime)s  %(message)s")
+        # Only build a formatter if there is something to watch.
+        self.formatter = ColourFormatter("%(asctime)s  %(message)s") if self.loggers else None
 
     def __enter__(self):
         self.watch()
@@ -63,6 +64,8 @@ class Watcher:
         self.stop()
 
     def watch(self, level=DEBUG, out=stderr):
+        if not self.loggers:
+            return
         self.stop()
         handler = StreamHandler(out)
         handler.setFormatter(self.formatter)
@@ -140,7 +140,7 @@ class Entity(Mapping):
 
     def __eq__(self, other):
         try:
-            return type(self) == type(other) and self.graph == other.graph and self.id == other.id
+            return type(self) is type(other) and self.graph == other.graph and self.id == other.id
         except AttributeError:
             return False
 
@@ -69,6 +69,9 @@ from neo4j.io import Bolt
 
 # python -m pytest tests/unit/test_exceptions.py -s -v
 
+SUPPORTED_VERSIONS = tuple(Bolt.protocol_handlers().keys())
+
+
 def test_bolt_error():
     with pytest.raises(BoltError) as e:
         error = BoltError("Error Message", address="localhost")
@@ -101,10 +104,9 @@ def test_bolt_protocol_error():
 def test_bolt_handshake_error():
     handshake = b"\x00\x00\x00\x04\x00\x00\x00\x03\x00\x00\x00\x00\x00\x00\x00\x00"
     response = b"\x00\x00\x00\x00"
-    supported_versions = Bolt.protocol_handlers().keys()
 
     with pytest.raises(BoltHandshakeError) as e:
-        error = BoltHandshakeError("The Neo4J server does not support communication with this driver. Supported Bolt Protocols {}".format(supported_versions), address="localhost", request_data=handshake, response_data=response)
+        error = BoltHandshakeError("The Neo4J server does not support communication with this driver. Supported Bolt Protocols {}".format(SUPPORTED_VERSIONS), address="localhost", request_data=handshake, response_data=response)
         assert error.address == "localhost"
         assert error.request_data == handshake
         assert error.response_data == response
@@ -121,24 +123,8 @@ def test_serviceunavailable():
     assert e.value.__cause__ is None
 
 
-def test_serviceunavailable_raised_from_bolt_protocol_error_with_implicit_style():
-    error = BoltProtocolError("Driver does not support Bolt protocol version: 0x%06X%02X" % (2, 5), address="localhost")
-    with pytest.raises(ServiceUnavailable) as e:
-        assert error.address == "localhost"
-        try:
-            raise error
-        except BoltProtocolError as error_bolt_protocol:
-            raise ServiceUnavailable(str(error_bolt_protocol)) from error_bolt_protocol
-
-    # The regexp parameter of the match method is matched with the re.search function.
-    with pytest.raises(AssertionError):
-        e.match("FAIL!")
-
-    e.match("Driver does not support Bolt protocol version: 0x00000205")
-    assert e.value.__cause__ is error
-
-
-def test_serviceunavailable_raised_from_bolt_protocol_error_with_explicit_style():
+@pytest.mark.parametrize("style", ("implicit", "explicit"))
+def test_serviceunavailable_raised_from_bolt_protocol_error(style):
     error = BoltProtocolError("Driver does not support Bolt protocol version: 0x%06X%02X" % (2, 5), address="localhost")
 
     with pytest.raises(ServiceUnavailable) as e:
@@ -146,6 +132,8 @@ def test_serviceunavailable_raised_from_bolt_protocol_error_with_explicit_style(
         try:
             raise error
         except BoltProtocolError as error_bolt_protocol:
+            if style == "implicit":
+                raise ServiceUnavailable(str(error_bolt_protocol)) from error_bolt_protocol
             error_nested = ServiceUnavailable(str(error_bolt_protocol))
             error_nested.__cause__ = error_bolt_protocol
             raise error_nested
@@ -219,22 +207,13 @@ def test_neo4jerror_hydrate_with_message_and_code_client():
     assert error.code == "Neo.{}.General.TestError".format(CLASSIFICATION_CLIENT)
 
 
-def test_transient_error_is_retriable_case_1():
-    error = Neo4jError.hydrate(message="Test error message", code="Neo.TransientError.Transaction.Terminated")
-
-    assert isinstance(error, TransientError)
-    assert error.is_retriable() is False
-
-
-def test_transient_error_is_retriable_case_2():
-    error = Neo4jError.hydrate(message="Test error message", code="Neo.TransientError.Transaction.LockClientStopped")
-
-    assert isinstance(error, TransientError)
-    assert error.is_retriable() is False
-
-
-def test_transient_error_is_retriable_case_3():
-    error = Neo4jError.hydrate(message="Test error message", code="Neo.TransientError.General.TestError")
+@pytest.mark.parametrize(("code", "retriable"), [
+    pytest.param("Neo.TransientError.Transaction.Terminated", False, id="transaction-terminated"),
+    pytest.param("Neo.TransientError.Transaction.LockClientStopped", False, id="lock-client-stopped"),
+    pytest.param("Neo.TransientError.General.TestError", True, id="general"),
+])
+def test_transient_error_is_retriable(code, retriable):
+    error = Neo4jError.hydrate(message="Test error message", code=code)
 
     assert isinstance(error, TransientError)
-    assert error.is_retriable() is True
+    assert error.is_retriable() is retriable